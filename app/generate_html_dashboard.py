@@ -4,21 +4,110 @@ Generate HTML Dashboard from metrics.json
 Creates a standalone HTML file that can be opened in any browser
 """
 
-import json
 import os
+from collections import ChainMap
 from datetime import datetime
+from typing import NamedTuple
+
+# Use orjson for parsing when it is installed, fall back to the stdlib
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
 
 # File paths
 METRICS_FILE = "reports/metrics.json"
 OUTPUT_FILE = "reports/dashboard.html"
 
 
+# Sections of metrics.json, with the defaults shown when a field is missing
+class Cpu(NamedTuple):
+    cpu_usage_percent: float = 0
+    cpu_cores: int = 0
+    cpu_model: str = "Unknown"
+    cpu_temperature: str = "N/A"
+    load_average: str = "N/A"
+
+
+class Memory(NamedTuple):
+    memory_total_mb: float = 0
+    memory_used_mb: float = 0
+    memory_available_mb: float = 0
+    memory_usage_percent: float = 0
+    swap_total_mb: float = 0
+    swap_used_mb: float = 0
+    swap_usage_percent: float = 0
+
+
+class Gpu(NamedTuple):
+    gpu_usage_percent: str = "N/A"
+    gpu_temperature: str = "N/A"
+    gpu_memory: str = "N/A"
+
+
+class Disk(NamedTuple):
+    filesystem: str = "N/A"
+    size: str = "N/A"
+    used: str = "N/A"
+    available: str = "N/A"
+    use_percent: float = 0
+
+
+class Net(NamedTuple):
+    interface: str = "N/A"
+    ip_address: str = "N/A"
+    rx_bytes: int = 0
+    tx_bytes: int = 0
+    rx_packets: int = 0
+    tx_packets: int = 0
+
+
+class SystemLoad(NamedTuple):
+    load_1min: float = 0
+    load_5min: float = 0
+    load_15min: float = 0
+    uptime: str = "N/A"
+
+
+def _from_dict(cls, data):
+    """Build a section from its JSON object, ignoring fields we don't show"""
+    fields = cls._fields
+    return cls(**{key: value for key, value in data.items() if key in fields})
+
+
+# Fallbacks for top-level keys missing from metrics.json
+_DEFAULTS = {
+    "hostname": "Unknown",
+    "timestamp": "N/A",
+    "cpu": {},
+    "memory": {},
+    "gpu": {},
+    "disk": [],
+    "network": [],
+    "system_load": {},
+}
+
+
+def parse_metrics(data):
+    """Wrap parsed metrics.json in its defaults and type its sections"""
+    metrics = ChainMap(data, _DEFAULTS)
+    metrics["cpu"] = _from_dict(Cpu, metrics["cpu"])
+    metrics["memory"] = _from_dict(Memory, metrics["memory"])
+    metrics["gpu"] = _from_dict(Gpu, metrics["gpu"])
+    metrics["disk"] = [_from_dict(Disk, disk) for disk in metrics["disk"]]
+    metrics["network"] = [_from_dict(Net, net) for net in metrics["network"]]
+    metrics["system_load"] = _from_dict(SystemLoad, metrics["system_load"])
+    return metrics
+
+
 def load_metrics():
     """Load the metrics JSON file"""
     try:
-        with open(METRICS_FILE, 'r') as f:
-            data = json.load(f)
-        return data
+        with open(METRICS_FILE, 'rb') as f:
+            data = _loads(f.read())
+        return parse_metrics(data)
     except FileNotFoundError:
         print(f"Error: Could not find {METRICS_FILE}")
         print("Run './scripts/monitor.sh -o' first to collect metrics")
@@ -28,190 +117,184 @@ def load_metrics():
         return None
 
 
+_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
+
 def format_bytes(bytes_value):
     """Convert bytes to readable format"""
-    if bytes_value == 0:
+    if not bytes_value:
         return "0 B"
     
-    # Convert to appropriate unit
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_value < 1024:
-            return f"{bytes_value:.2f} {unit}"
-        bytes_value = bytes_value / 1024
-    return f"{bytes_value:.2f} PB"
+    # Each unit is 10 bits wide, so the bit length picks the unit directly
+    i = min(max(0, (int(bytes_value).bit_length() - 1) // 10), len(_UNITS) - 1)
+    return f"{bytes_value / (1 << (i * 10)):.2f} {_UNITS[i]}"
+
+
+def format_count(count):
+    """Format a counter with thousands separators"""
+    # Counters below a million only need one separator
+    if type(count) is int and 0 <= count < 1_000_000:
+        return str(count) if count < 1000 else f"{count // 1000},{count % 1000:03d}"
+    return f"{count:,}"
+
+
+# Characters that must not reach the page unescaped
+_HTML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
+
+def escape_html(value):
+    """Escape a collected string for use in the page, pass other values through"""
+    if isinstance(value, str):
+        return value.translate(_HTML_ESCAPE_TABLE)
+    return value
+
+
+# df-style size suffixes and their readable form
+_SUFFIX_MAP = {"Ki": " KB", "Mi": " MB", "Gi": " GB", "Ti": " TB"}
+
+
+def normalize_size(size):
+    """Convert a df size like '113Gi' to '113 GB'"""
+    suffix = size[-2:]
+    if suffix in _SUFFIX_MAP:
+        return size[:-2] + _SUFFIX_MAP[suffix]
+    return size
+
+
+# Status colors: green (< 50%), yellow (< 80%), red
+_COLORS = ("#28a745", "#ffc107", "#dc3545")
 
 
 def get_status_color(percent):
     """Get color based on usage percentage"""
-    if percent < 50:
-        return "#28a745"  # green
-    elif percent < 80:
-        return "#ffc107"  # yellow
-    else:
-        return "#dc3545"  # red
+    return _COLORS[(percent >= 50) + (percent >= 80)]
 
 
-def generate_html(metrics):
-    """Generate the HTML dashboard"""
-    
-    # Get data from metrics
-    cpu = metrics.get("cpu", {})
-    memory = metrics.get("memory", {})
-    disks = metrics.get("disk", [])
-    gpu = metrics.get("gpu", {})
-    networks = metrics.get("network", [])
-    system_load = metrics.get("system_load", {})
-    
-    # CPU values
-    cpu_usage = cpu.get("cpu_usage_percent", 0)
-    cpu_cores = cpu.get("cpu_cores", 0)
-    cpu_temp = cpu.get("cpu_temperature", "N/A")
-    cpu_model = cpu.get("cpu_model", "Unknown")
-    load_avg = cpu.get("load_average", "N/A")
-    
-    # Memory values
-    mem_total = memory.get("memory_total_mb", 0)
-    mem_used = memory.get("memory_used_mb", 0)
-    mem_available = memory.get("memory_available_mb", 0)
-    mem_percent = memory.get("memory_usage_percent", 0)
-    swap_total = memory.get("swap_total_mb", 0)
-    swap_used = memory.get("swap_used_mb", 0)
-    swap_percent = memory.get("swap_usage_percent", 0)
-    
-    # Filter out system disks (keep only main ones)
-    main_disks = []
-    for disk in disks:
-        fs = disk.get("filesystem", "")
-        if not fs.startswith("devfs") and not fs.startswith("map"):
-            main_disks.append(disk)
-    
-    # Filter active network interfaces
-    active_networks = []
-    for net in networks:
-        if net.get("rx_bytes", 0) > 0 or net.get("tx_bytes", 0) > 0:
-            active_networks.append(net)
-    
-    # Start building HTML
-    html = f"""<!DOCTYPE html>
+# HTML fragments, written out in order. Static ones are encoded to UTF-8
+# once at import, the rest are str.format templates.
+_PAGE_START = """<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>System Monitor Dashboard</title>
-    <style>
-        * {{
+    <style>""".encode("utf-8")
+
+# Static stylesheet, written between the <style> tags as-is
+_CSS = """
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             padding: 20px;
             min-height: 100vh;
-        }}
+        }
         
-        .container {{
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             background: white;
             border-radius: 10px;
             box-shadow: 0 10px 40px rgba(0,0,0,0.2);
             overflow: hidden;
-        }}
+        }
         
-        .header {{
+        .header {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 30px;
             text-align: center;
-        }}
+        }
         
-        .header h1 {{
+        .header h1 {
             font-size: 2.5em;
             margin-bottom: 10px;
-        }}
+        }
         
-        .info-bar {{
+        .info-bar {
             display: flex;
             justify-content: space-around;
             padding: 20px;
             background: #f8f9fa;
             border-bottom: 2px solid #e9ecef;
-        }}
+        }
         
-        .info-item {{
+        .info-item {
             text-align: center;
-        }}
+        }
         
-        .info-item label {{
+        .info-item label {
             display: block;
             color: #6c757d;
             font-size: 0.9em;
             margin-bottom: 5px;
-        }}
+        }
         
-        .info-item value {{
+        .info-item value {
             display: block;
             font-size: 1.2em;
             font-weight: bold;
             color: #333;
-        }}
+        }
         
-        .section {{
+        .section {
             padding: 30px;
             border-bottom: 1px solid #e9ecef;
-        }}
+        }
         
-        .section:last-child {{
+        .section:last-child {
             border-bottom: none;
-        }}
+        }
         
-        .section-title {{
+        .section-title {
             font-size: 1.8em;
             margin-bottom: 20px;
             color: #667eea;
-        }}
+        }
         
-        .metrics-row {{
+        .metrics-row {
             display: flex;
             flex-wrap: wrap;
             gap: 20px;
             margin-bottom: 20px;
-        }}
+        }
         
-        .metric-card {{
+        .metric-card {
             flex: 1;
             min-width: 200px;
             background: #f8f9fa;
             padding: 20px;
             border-radius: 8px;
             border-left: 4px solid #667eea;
-        }}
+        }
         
-        .metric-card h3 {{
+        .metric-card h3 {
             color: #6c757d;
             font-size: 0.9em;
             margin-bottom: 10px;
-        }}
+        }
         
-        .metric-card .value {{
+        .metric-card .value {
             font-size: 2em;
             font-weight: bold;
             color: #333;
-        }}
+        }
         
-        .progress-bar {{
+        .progress-bar {
             width: 100%;
             height: 25px;
             background: #e9ecef;
             border-radius: 12px;
             overflow: hidden;
             margin-top: 10px;
-        }}
+        }
         
-        .progress-fill {{
+        .progress-fill {
             height: 100%;
             border-radius: 12px;
             display: flex;
@@ -220,46 +303,48 @@ def generate_html(metrics):
             color: white;
             font-weight: bold;
             font-size: 0.85em;
-        }}
+        }
         
-        table {{
+        table {
             width: 100%;
             border-collapse: collapse;
             margin-top: 20px;
-        }}
+        }
         
-        table th {{
+        table th {
             background: #667eea;
             color: white;
             padding: 12px;
             text-align: left;
-        }}
+        }
         
-        table td {{
+        table td {
             padding: 12px;
             border-bottom: 1px solid #e9ecef;
-        }}
+        }
         
-        table tr:hover {{
+        table tr:hover {
             background: #f8f9fa;
-        }}
+        }
         
-        .badge {{
+        .badge {
             display: inline-block;
             padding: 4px 10px;
             border-radius: 4px;
             color: white;
             font-size: 0.85em;
             font-weight: bold;
-        }}
+        }
         
-        .footer {{
+        .footer {
             text-align: center;
             padding: 20px;
             background: #f8f9fa;
             color: #6c757d;
-        }}
-    </style>
+        }
+    """.encode("utf-8")
+
+_PAGE_HEAD = """</style>
 </head>
 <body>
     <div class="container">
@@ -271,15 +356,15 @@ def generate_html(metrics):
         <div class="info-bar">
             <div class="info-item">
                 <label>Hostname</label>
-                <value>{metrics.get("hostname", "Unknown")}</value>
+                <value>{hostname}</value>
             </div>
             <div class="info-item">
                 <label>Last Update</label>
-                <value>{metrics.get("timestamp", "N/A")}</value>
+                <value>{timestamp}</value>
             </div>
             <div class="info-item">
                 <label>Uptime</label>
-                <value>{system_load.get("uptime", "N/A")}</value>
+                <value>{uptime}</value>
             </div>
         </div>
         
@@ -291,7 +376,7 @@ def generate_html(metrics):
                     <h3>CPU Usage</h3>
                     <div class="value">{cpu_usage:.1f}%</div>
                     <div class="progress-bar">
-                        <div class="progress-fill" style="width: {cpu_usage}%; background: {get_status_color(cpu_usage)};">
+                        <div class="progress-fill" style="width: {cpu_usage}%; background: {cpu_color};">
                             {cpu_usage:.1f}%
                         </div>
                     </div>
@@ -318,66 +403,62 @@ def generate_html(metrics):
             <div class="metrics-row">
                 <div class="metric-card">
                     <h3>Total Memory</h3>
-                    <div class="value">{mem_total / 1024:.2f} GB</div>
+                    <div class="value">{mem_total_gb:.2f} GB</div>
                 </div>
                 <div class="metric-card">
                     <h3>Used Memory</h3>
-                    <div class="value">{mem_used / 1024:.2f} GB</div>
+                    <div class="value">{mem_used_gb:.2f} GB</div>
                 </div>
                 <div class="metric-card">
                     <h3>Available Memory</h3>
-                    <div class="value">{mem_available / 1024:.2f} GB</div>
+                    <div class="value">{mem_available_gb:.2f} GB</div>
                 </div>
                 <div class="metric-card">
                     <h3>Memory Usage</h3>
                     <div class="value">
-                        <span class="badge" style="background: {get_status_color(mem_percent)};">{mem_percent:.1f}%</span>
+                        <span class="badge" style="background: {mem_color};">{mem_percent:.1f}%</span>
                     </div>
                     <div class="progress-bar">
-                        <div class="progress-fill" style="width: {mem_percent}%; background: {get_status_color(mem_percent)};">
+                        <div class="progress-fill" style="width: {mem_percent}%; background: {mem_color};">
                             {mem_percent:.1f}%
                         </div>
                     </div>
                 </div>
             </div>
 """
-    
-    # Add swap if available
-    if swap_total > 0:
-        html += f"""
+
+_SWAP_SECTION = """
             <div class="metrics-row" style="margin-top: 20px;">
                 <div class="metric-card">
                     <h3>Swap Total</h3>
-                    <div class="value">{swap_total / 1024:.2f} GB</div>
+                    <div class="value">{swap_total_gb:.2f} GB</div>
                 </div>
                 <div class="metric-card">
                     <h3>Swap Used</h3>
-                    <div class="value">{swap_used / 1024:.2f} GB</div>
+                    <div class="value">{swap_used_gb:.2f} GB</div>
                 </div>
                 <div class="metric-card">
                     <h3>Swap Usage</h3>
                     <div class="value">
-                        <span class="badge" style="background: {get_status_color(swap_percent)};">{swap_percent:.1f}%</span>
+                        <span class="badge" style="background: {swap_color};">{swap_percent:.1f}%</span>
                     </div>
                     <div class="progress-bar">
-                        <div class="progress-fill" style="width: {swap_percent}%; background: {get_status_color(swap_percent)};">
+                        <div class="progress-fill" style="width: {swap_percent}%; background: {swap_color};">
                             {swap_percent:.1f}%
                         </div>
                     </div>
                 </div>
             </div>
 """
-    
-    # Disk Section
-    html += """
+
+_DISK_SECTION_START = """
         </div>
         
         <div class="section">
             <div class="section-title">💿 Disk Metrics</div>
-"""
-    
-    if main_disks:
-        html += """
+""".encode("utf-8")
+
+_DISK_TABLE_START = """
             <table>
                 <thead>
                     <tr>
@@ -389,73 +470,58 @@ def generate_html(metrics):
                     </tr>
                 </thead>
                 <tbody>
-"""
-        for disk in main_disks:
-            usage = disk.get("use_percent", 0)
-            size = disk.get("size", "N/A")
-            used = disk.get("used", "N/A")
-            available = disk.get("available", "N/A")
-            
-            # Format size strings
-            if size.endswith('Gi'):
-                size = size.replace('Gi', ' GB')
-            if used.endswith('Gi'):
-                used = used.replace('Gi', ' GB')
-            if available.endswith('Gi'):
-                available = available.replace('Gi', ' GB')
-            
-            html += f"""
+""".encode("utf-8")
+
+_DISK_ROW = """
                     <tr>
-                        <td>{disk.get("filesystem", "N/A")}</td>
+                        <td>{filesystem}</td>
                         <td>{size}</td>
                         <td>{used}</td>
                         <td>{available}</td>
                         <td>
-                            <span class="badge" style="background: {get_status_color(usage)};">{usage}%</span>
+                            <span class="badge" style="background: {color};">{usage}%</span>
                         </td>
                     </tr>
 """
-        html += """
+
+# One disk row per status color, with the badge color already filled in
+_DISK_ROWS = tuple(_DISK_ROW.replace("{color}", color) for color in _COLORS)
+
+_TABLE_END = """
                 </tbody>
             </table>
-"""
-    else:
-        html += '<p style="color: #6c757d;">No disk information available</p>'
-    
-    # GPU Section
-    html += """
+""".encode("utf-8")
+
+_NO_DISKS = '<p style="color: #6c757d;">No disk information available</p>'.encode("utf-8")
+
+_GPU_SECTION = """
         </div>
         
         <div class="section">
             <div class="section-title">🎮 GPU Metrics</div>
             <div class="metrics-row">
-"""
-    html += f"""
+
                 <div class="metric-card">
                     <h3>GPU Usage</h3>
-                    <div class="value">{gpu.get("gpu_usage_percent", "N/A")}</div>
+                    <div class="value">{gpu_usage}</div>
                 </div>
                 <div class="metric-card">
                     <h3>GPU Temperature</h3>
-                    <div class="value">{gpu.get("gpu_temperature", "N/A")}</div>
+                    <div class="value">{gpu_temp}</div>
                 </div>
                 <div class="metric-card">
                     <h3>GPU Memory</h3>
-                    <div class="value">{gpu.get("gpu_memory", "N/A")}</div>
+                    <div class="value">{gpu_memory}</div>
                 </div>
-"""
-    
-    # Network Section
-    html += """
+
             </div>
         </div>
         
         <div class="section">
             <div class="section-title">🌐 Network Metrics</div>
 """
-    
-    if active_networks:
-        html += """
+
+_NETWORK_TABLE_START = """
             <table>
                 <thead>
                     <tr>
@@ -468,88 +534,194 @@ def generate_html(metrics):
                     </tr>
                 </thead>
                 <tbody>
-"""
-        for net in active_networks:
-            html += f"""
+""".encode("utf-8")
+
+_NETWORK_ROW = """
                     <tr>
-                        <td>{net.get("interface", "N/A")}</td>
-                        <td>{net.get("ip_address", "N/A")}</td>
-                        <td>{format_bytes(net.get("rx_bytes", 0))}</td>
-                        <td>{format_bytes(net.get("tx_bytes", 0))}</td>
-                        <td>{net.get("rx_packets", 0):,}</td>
-                        <td>{net.get("tx_packets", 0):,}</td>
+                        <td>{interface}</td>
+                        <td>{ip_address}</td>
+                        <td>{rx}</td>
+                        <td>{tx}</td>
+                        <td>{rx_packets}</td>
+                        <td>{tx_packets}</td>
                     </tr>
 """
-        html += """
-                </tbody>
-            </table>
-"""
-    else:
-        html += '<p style="color: #6c757d;">No active network interfaces</p>'
-    
-    # System Load Section
-    html += """
+
+_NO_NETWORKS = '<p style="color: #6c757d;">No active network interfaces</p>'.encode("utf-8")
+
+_PAGE_FOOT = """
         </div>
         
         <div class="section">
             <div class="section-title">⚙️ System Load</div>
             <div class="metrics-row">
-"""
-    html += f"""
+
                 <div class="metric-card">
                     <h3>Load (1 min)</h3>
-                    <div class="value">{system_load.get("load_1min", 0):.2f}</div>
+                    <div class="value">{load_1min:.2f}</div>
                 </div>
                 <div class="metric-card">
                     <h3>Load (5 min)</h3>
-                    <div class="value">{system_load.get("load_5min", 0):.2f}</div>
+                    <div class="value">{load_5min:.2f}</div>
                 </div>
                 <div class="metric-card">
                     <h3>Load (15 min)</h3>
-                    <div class="value">{system_load.get("load_15min", 0):.2f}</div>
+                    <div class="value">{load_15min:.2f}</div>
                 </div>
                 <div class="metric-card">
                     <h3>Uptime</h3>
-                    <div class="value">{system_load.get("uptime", "N/A")}</div>
+                    <div class="value">{uptime}</div>
                 </div>
             </div>
         </div>
-"""
-    
-    # Footer
-    html += f"""
+
         <div class="footer">
-            Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+            Generated on {generated_on}
         </div>
     </div>
 </body>
 </html>
 """
+
+
+def disk_row(disk):
+    """Render one disk table row as UTF-8 bytes"""
+    usage = disk.use_percent
+    return _DISK_ROWS[(usage >= 50) + (usage >= 80)].format(
+        filesystem=escape_html(disk.filesystem),
+        size=escape_html(normalize_size(disk.size)),
+        used=escape_html(normalize_size(disk.used)),
+        available=escape_html(normalize_size(disk.available)),
+        usage=usage,
+    ).encode("utf-8")
+
+
+def network_row(net):
+    """Render one network table row as UTF-8 bytes"""
+    return _NETWORK_ROW.format(
+        interface=escape_html(net.interface),
+        ip_address=escape_html(net.ip_address),
+        rx=format_bytes(net.rx_bytes),
+        tx=format_bytes(net.tx_bytes),
+        rx_packets=format_count(net.rx_packets),
+        tx_packets=format_count(net.tx_packets),
+    ).encode("utf-8")
+
+
+def write_html(metrics, fp, generated_on):
+    """Write the HTML dashboard to a file opened in binary mode"""
+    
+    # Get data from metrics (see parse_metrics)
+    cpu = metrics["cpu"]
+    memory = metrics["memory"]
+    gpu = metrics["gpu"]
+    system_load = metrics["system_load"]
+    
+    # Values used more than once below
+    cpu_usage = cpu.cpu_usage_percent
+    mem_percent = memory.memory_usage_percent
+    swap_total = memory.swap_total_mb
+    swap_percent = memory.swap_usage_percent
+    uptime = escape_html(system_load.uptime)
     
-    return html
+    # Filter out system disks (keep only main ones)
+    main_disks = [
+        disk for disk in metrics["disk"]
+        if not disk.filesystem.startswith(("devfs", "map"))
+    ]
+    
+    # Filter active network interfaces
+    active_networks = [
+        net for net in metrics["network"]
+        if net.rx_bytes or net.tx_bytes
+    ]
+    
+    fp.write(_PAGE_START)
+    fp.write(_CSS)
+    fp.write(_PAGE_HEAD.format(
+        hostname=escape_html(metrics["hostname"]),
+        timestamp=escape_html(metrics["timestamp"]),
+        uptime=uptime,
+        cpu_usage=cpu_usage,
+        cpu_color=get_status_color(cpu_usage),
+        cpu_cores=cpu.cpu_cores,
+        cpu_temp=escape_html(cpu.cpu_temperature),
+        cpu_model=escape_html(cpu.cpu_model),
+        load_avg=escape_html(cpu.load_average),
+        mem_total_gb=memory.memory_total_mb / 1024,
+        mem_used_gb=memory.memory_used_mb / 1024,
+        mem_available_gb=memory.memory_available_mb / 1024,
+        mem_percent=mem_percent,
+        mem_color=get_status_color(mem_percent),
+    ).encode("utf-8"))
+    
+    # Add swap if available
+    if swap_total > 0:
+        fp.write(_SWAP_SECTION.format(
+            swap_total_gb=swap_total / 1024,
+            swap_used_gb=memory.swap_used_mb / 1024,
+            swap_percent=swap_percent,
+            swap_color=get_status_color(swap_percent),
+        ).encode("utf-8"))
+    
+    # Disk table
+    fp.write(_DISK_SECTION_START)
+    if main_disks:
+        fp.write(_DISK_TABLE_START)
+        fp.writelines(map(disk_row, main_disks))
+        fp.write(_TABLE_END)
+    else:
+        fp.write(_NO_DISKS)
+    
+    # GPU cards
+    fp.write(_GPU_SECTION.format(
+        gpu_usage=escape_html(gpu.gpu_usage_percent),
+        gpu_temp=escape_html(gpu.gpu_temperature),
+        gpu_memory=escape_html(gpu.gpu_memory),
+    ).encode("utf-8"))
+    
+    # Network table
+    if active_networks:
+        fp.write(_NETWORK_TABLE_START)
+        fp.writelines(map(network_row, active_networks))
+        fp.write(_TABLE_END)
+    else:
+        fp.write(_NO_NETWORKS)
+    
+    # System load and footer
+    fp.write(_PAGE_FOOT.format(
+        load_1min=system_load.load_1min,
+        load_5min=system_load.load_5min,
+        load_15min=system_load.load_15min,
+        uptime=uptime,
+        generated_on=generated_on,
+    ).encode("utf-8"))
 
 
 def main():
     """Main function to generate the dashboard"""
     print(f"Loading metrics from {METRICS_FILE}...")
     
+    # Resolve the output path and timestamp once per run
+    output_path = os.path.abspath(OUTPUT_FILE)
+    generated_on = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    
     metrics = load_metrics()
     if metrics is None:
         return
     
     print("Generating HTML dashboard...")
-    html = generate_html(metrics)
     
     # Make sure reports directory exists
-    os.makedirs(os.path.dirname(OUTPUT_FILE), exist_ok=True)
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
     
-    # Write HTML file
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-        f.write(html)
+    # Stream the HTML straight into the output file
+    with open(output_path, 'wb', buffering=1 << 16) as f:
+        write_html(metrics, f, generated_on)
     
     print(f"✅ Dashboard generated successfully!")
     print(f"📄 File: {OUTPUT_FILE}")
-    print(f"🌐 Open in browser: file://{os.path.abspath(OUTPUT_FILE)}")
+    print(f"🌐 Open in browser: file://{output_path}")
 
 
 if __name__ == "__main__":
@@ -22,7 +22,8 @@ while true; do
     # Generate HTML dashboard
     if [ -f "$PROJECT_ROOT/generate_html_dashboard.py" ]; then
         echo "Generating HTML dashboard..."
-        python3 "$PROJECT_ROOT/generate_html_dashboard.py"
+        # Run as a module so the compiled bytecode is reused between iterations
+        PYTHONPATH="$PROJECT_ROOT" python3 -m generate_html_dashboard
     else
         echo "Warning: generate_html_dashboard.py not found"
     fi